@@ -5,57 +5,86 @@ Contact: dome.braun@fau.de
 Last Update: 2024-06-05
 """
 
-from aenum import Enum, auto
+from enum import IntEnum, auto
+from types import MappingProxyType
+from typing import Mapping
 
 
 ############# ENUMS #############
-class DeviceType(Enum):
+class DeviceType(IntEnum):
     """
     Enum class for the different available devices.
     Add new devices here.
     """
 
-    _init_ = "value __doc__"
-    OTB_QUATTROCENTO = auto(), "OT Bioelettronica Quattrocento"
-    OTB_QUATTROCENTO_LIGHT = auto(), "OT Bioelettronica Quattrocento Light"
-    OTB_MUOVI = auto(), "OT Bioelettronica Muovi"
-    OTB_MUOVI_PLUS = auto(), "OT Bioelettronica Muovi Plus"
-    OTB_SYNCSTATION = auto(), "OT Bioelettronica SyncStation"
+    OTB_QUATTROCENTO = auto()
+    OTB_QUATTROCENTO_LIGHT = auto()
+    OTB_MUOVI = auto()
+    OTB_MUOVI_PLUS = auto()
+    OTB_SYNCSTATION = auto()
 
 
-class OTBDeviceType(Enum):
+class OTBDeviceType(IntEnum):
     """
     Enum class for the different available OT Bioelettronica devices.
     Add new devices here.
     """
 
-    _init_ = "value __doc__"
+    QUATTROCENTO = auto()
+    QUATTROCENTO_LIGHT = auto()
+    MUOVI = auto()
+    MUOVI_PLUS = auto()
+    SYNCSTATION = auto()
 
-    QUATTROCENTO = auto(), "Quattrocento"
-    QUATTROCENTO_LIGHT = auto(), "Quattrocento Light"
-    MUOVI = auto(), "Muovi"
-    MUOVI_PLUS = auto(), "Muovi Plus"
-    SYNCSTATION = auto(), "SyncStation"
 
+class DeviceChannelTypes(IntEnum):
+    ALL = auto()
+    AUXILIARY = auto()
+    BIOSIGNAL = auto()
 
-class DeviceChannelTypes(Enum):
-    _init_ = "value __doc__"
 
-    ALL = auto(), "All"
-    AUXILIARY = auto(), "Auxiliary"
-    BIOSIGNAL = auto(), "Biosignal"
+DEVICE_TYPE_DOC: Mapping[DeviceType, str] = MappingProxyType(
+    {
+        DeviceType.OTB_QUATTROCENTO: "OT Bioelettronica Quattrocento",
+        DeviceType.OTB_QUATTROCENTO_LIGHT: "OT Bioelettronica Quattrocento Light",
+        DeviceType.OTB_MUOVI: "OT Bioelettronica Muovi",
+        DeviceType.OTB_MUOVI_PLUS: "OT Bioelettronica Muovi Plus",
+        DeviceType.OTB_SYNCSTATION: "OT Bioelettronica SyncStation",
+    }
+)
+"""Member descriptions of DeviceType, formerly per-member __doc__ strings."""
 
 
 ############# CONSTANTS #############
-DEVICE_NAME_DICT: dict[DeviceType | OTBDeviceType, str] = {
-    DeviceType.OTB_QUATTROCENTO: "Quattrocento",
-    OTBDeviceType.QUATTROCENTO: "Quattrocento",
-    DeviceType.OTB_QUATTROCENTO_LIGHT: "Quattrocento Light",
-    OTBDeviceType.QUATTROCENTO_LIGHT: "Quattrocento Light",
-    DeviceType.OTB_MUOVI: "Muovi",
-    OTBDeviceType.MUOVI: "Muovi",
-    DeviceType.OTB_MUOVI_PLUS: "Muovi Plus",
-    OTBDeviceType.MUOVI_PLUS: "Muovi Plus",
-    DeviceType.OTB_SYNCSTATION: "SyncStation",
-    OTBDeviceType.SYNCSTATION: "SyncStation",
-}
+DEVICE_NAMES: tuple[str, ...] = (
+    "Quattrocento",
+    "Quattrocento Light",
+    "Muovi",
+    "Muovi Plus",
+    "SyncStation",
+)
+"""Device names ordered by the auto() order of the device type enums."""
+
+
+def device_name(device_type: DeviceType | OTBDeviceType) -> str:
+    """
+    Returns the display name of a device type.
+
+    Args:
+        device_type (DeviceType | OTBDeviceType):
+            Device type to look up.
+
+    Returns:
+        str:
+            Name of the device.
+    """
+    return DEVICE_NAMES[device_type.value - 1]
+
+
+# Compatibility shim generated from DEVICE_NAMES. Prefer device_name().
+DEVICE_NAME_DICT: Mapping[DeviceType | OTBDeviceType, str] = MappingProxyType(
+    {
+        **{member: DEVICE_NAMES[member.value - 1] for member in DeviceType},
+        **{member: DEVICE_NAMES[member.value - 1] for member in OTBDeviceType},
+    }
+)
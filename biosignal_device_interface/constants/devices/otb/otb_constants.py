@@ -0,0 +1,50 @@
+"""
+Shared constants and helpers for OT Bioelettronica devices.
+
+Developer: Dominik I. Braun
+Contact: dome.braun@fau.de
+Last Update: 2026-08-29
+"""
+
+CRC8_MAXIM_POLYNOMIAL: int = 0x8C
+"""Reflected CRC-8/MAXIM polynomial used by the OTB command protocol."""
+
+
+def _build_crc8_maxim_table(polynomial: int) -> tuple[int, ...]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ polynomial if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+CRC8_MAXIM_TABLE: tuple[int, ...] = _build_crc8_maxim_table(CRC8_MAXIM_POLYNOMIAL)
+"""Precomputed 256-entry lookup table for crc8_maxim."""
+
+
+def crc8_maxim(command_bytes: bytearray, command_length: int | None = None) -> int:
+    """
+    Computes the CRC-8/MAXIM checksum of a command byte sequence.
+
+    Table-driven equivalent of the bit-serial example code provided by
+    OT Bioelettronica; one table lookup per byte instead of eight
+    branchy bit iterations.
+
+    Args:
+        command_bytes (bytearray):
+            Bytes to checksum.
+
+        command_length (int, optional):
+            Number of leading bytes to include.
+            Defaults to the full length.
+
+    Returns:
+        int:
+            CRC byte of the command sequence.
+    """
+    crc = 0
+    for byte in command_bytes[:command_length]:
+        crc = CRC8_MAXIM_TABLE[crc ^ byte]
+    return crc
@@ -1,4 +1,6 @@
-from aenum import Enum, auto
+from enum import Enum, auto
+from types import MappingProxyType
+from typing import Mapping
 
 from biosignal_device_interface.constants.devices.core.base_device_constants import (
     DeviceType,
@@ -19,14 +21,22 @@ class MuoviWorkingMode(Enum):
 
     """
 
-    _init_ = "value __doc__"
+    NONE = 0
+    EEG = auto()
+    EMG = auto()
 
-    NONE = 0, "No working mode set."
-    EEG = auto(), "EEG Mode: FSAMP 500 Hz, DC coupled, 24 bit resolution"
-    EMG = (
-        auto(),
-        "EMG Mode: FSAMP 2000 Hz, DC coupled, 16 bit resolution, High pass filtered at 10 Hz",
-    )
+
+MUOVI_WORKING_MODE_DOC: Mapping[MuoviWorkingMode, str] = MappingProxyType(
+    {
+        MuoviWorkingMode.NONE: "No working mode set.",
+        MuoviWorkingMode.EEG: "EEG Mode: FSAMP 500 Hz, DC coupled, 24 bit resolution",
+        MuoviWorkingMode.EMG: (
+            "EMG Mode: FSAMP 2000 Hz, DC coupled, 16 bit resolution, "
+            "High pass filtered at 10 Hz"
+        ),
+    }
+)
+"""Member descriptions of MuoviWorkingMode, formerly per-member __doc__ strings."""
 
 
 class MuoviDetectionMode(Enum):
@@ -40,32 +50,46 @@ class MuoviDetectionMode(Enum):
         4 and +/-300mV when the preamp is set to 8.
     """
 
-    _init_ = "value __doc__"
-
-    NONE = 0, "No detection mode set."
-    MONOPOLAR_GAIN_8 = auto(), (
-        "Monopolar Mode.preamp gain 8. 32 monopolar bioelectrical signals + 6 accessory signals. "
-        "Resolution is 286.1 nV and range +/-9.375 mV."
-    )
-    MONOPOLAR_GAIN_4 = auto(), (
-        "Monopolar Mode (Only EMG -> EEG=>Mode 0). preamp gain 4. "
-        "32 bioelectrical signals + 6 accessory signals. "
-        "Resolution is 572.2nV and range +/-18.75 mV."
+    NONE = 0
+    MONOPOLAR_GAIN_8 = auto()
+    MONOPOLAR_GAIN_4 = auto()
+    IMPEDANCE_CHECK = auto()
+    TEST = auto()
+
+
+MUOVI_DETECTION_MODE_DOC: Mapping[MuoviDetectionMode, str] = MappingProxyType(
+    {
+        MuoviDetectionMode.NONE: "No detection mode set.",
+        MuoviDetectionMode.MONOPOLAR_GAIN_8: (
+            "Monopolar Mode.preamp gain 8. 32 monopolar bioelectrical signals "
+            "+ 6 accessory signals. Resolution is 286.1 nV and range +/-9.375 mV."
+        ),
+        MuoviDetectionMode.MONOPOLAR_GAIN_4: (
+            "Monopolar Mode (Only EMG -> EEG=>Mode 0). preamp gain 4. "
+            "32 bioelectrical signals + 6 accessory signals. "
+            "Resolution is 572.2nV and range +/-18.75 mV."
+        ),
+        MuoviDetectionMode.IMPEDANCE_CHECK: "Impedance Check on all 32 + 6 channels.",
+        MuoviDetectionMode.TEST: "Ramps on all 32 + 6 channels.",
+    }
+)
+"""Member descriptions of MuoviDetectionMode, formerly per-member __doc__ strings."""
+
+
+MUOVI_WORKING_MODE_CHARACTERISTICS_DICT: Mapping[MuoviWorkingMode, dict[str, int]] = (
+    MappingProxyType(
+        {
+            MuoviWorkingMode.EEG: {
+                "sampling_frequency": 500,
+                "bytes_per_sample": 3,
+            },
+            MuoviWorkingMode.EMG: {
+                "sampling_frequency": 2000,
+                "bytes_per_sample": 2,
+            },
+        }
     )
-    IMPEDANCE_CHECK = auto(), "Impedance Check on all 32 + 6 channels."
-    TEST = auto(), "Ramps on all 32 + 6 channels."
-
-
-MUOVI_WORKING_MODE_CHARACTERISTICS_DICT: dict[MuoviWorkingMode, dict[str, int]] = {
-    MuoviWorkingMode.EEG: {
-        "sampling_frequency": 500,
-        "bytes_per_sample": 3,
-    },
-    MuoviWorkingMode.EMG: {
-        "sampling_frequency": 2000,
-        "bytes_per_sample": 2,
-    },
-}
+)
 """
 Dictionary to get characteristics of the Muovi working mode.
 
@@ -77,16 +101,20 @@ The values are dictionaries with the following keys:
 """
 
 
-MUOVI_SAMPLES_PER_FRAME_DICT: dict[DeviceType, dict[MuoviWorkingMode, int]] = {
-    DeviceType.OTB_MUOVI: {
-        MuoviWorkingMode.EEG: 12,
-        MuoviWorkingMode.EMG: 18,
-    },
-    DeviceType.OTB_MUOVI_PLUS: {
-        MuoviWorkingMode.EEG: 6,
-        MuoviWorkingMode.EMG: 10,
-    },
-}
+MUOVI_SAMPLES_PER_FRAME_DICT: Mapping[DeviceType, dict[MuoviWorkingMode, int]] = (
+    MappingProxyType(
+        {
+            DeviceType.OTB_MUOVI: {
+                MuoviWorkingMode.EEG: 12,
+                MuoviWorkingMode.EMG: 18,
+            },
+            DeviceType.OTB_MUOVI_PLUS: {
+                MuoviWorkingMode.EEG: 6,
+                MuoviWorkingMode.EMG: 10,
+            },
+        }
+    )
+)
 """
 Dictionary to get the frame length of the Muovi.
 
@@ -97,27 +125,33 @@ The values are dictionaries with the following keys:
     - MuoviWorkingMode.EMG: The frame length of the EMG working mode.
 """
 
-MUOVI_AVAILABLE_CHANNELS_DICT: dict[DeviceType, dict[DeviceChannelTypes, int]] = {
-    DeviceType.OTB_MUOVI: {
-        DeviceChannelTypes.ALL: 38,
-        DeviceChannelTypes.BIOSIGNAL: 32,
-        DeviceChannelTypes.AUXILIARY: 6,
-    },
-    DeviceType.OTB_MUOVI_PLUS: {
-        DeviceChannelTypes.ALL: 70,
-        DeviceChannelTypes.BIOSIGNAL: 64,
-        DeviceChannelTypes.AUXILIARY: 6,
-    },
-}
+MUOVI_AVAILABLE_CHANNELS_DICT: Mapping[DeviceType, dict[DeviceChannelTypes, int]] = (
+    MappingProxyType(
+        {
+            DeviceType.OTB_MUOVI: {
+                DeviceChannelTypes.ALL: 38,
+                DeviceChannelTypes.BIOSIGNAL: 32,
+                DeviceChannelTypes.AUXILIARY: 6,
+            },
+            DeviceType.OTB_MUOVI_PLUS: {
+                DeviceChannelTypes.ALL: 70,
+                DeviceChannelTypes.BIOSIGNAL: 64,
+                DeviceChannelTypes.AUXILIARY: 6,
+            },
+        }
+    )
+)
 
 """
 
 """
 
-MUOVI_CONVERSION_FACTOR_DICT: dict[MuoviDetectionMode, int] = {
-    MuoviDetectionMode.MONOPOLAR_GAIN_8: 572.2e-6,
-    MuoviDetectionMode.MONOPOLAR_GAIN_4: 286.1e-6,
-}
+MUOVI_CONVERSION_FACTOR_DICT: Mapping[MuoviDetectionMode, int] = MappingProxyType(
+    {
+        MuoviDetectionMode.MONOPOLAR_GAIN_8: 572.2e-6,
+        MuoviDetectionMode.MONOPOLAR_GAIN_4: 286.1e-6,
+    }
+)
 """
 Dictionary to get the gain of the Muovi detection mode. \\
 The keys are the detection modes of the Muovi device. \\
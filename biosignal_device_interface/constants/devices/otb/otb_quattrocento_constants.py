@@ -1,4 +1,4 @@
-from aenum import Enum, auto
+from enum import Enum, auto
 
 """
 Quattrocento constants.
@@ -13,19 +13,21 @@ Last Update: 2025-01-14
 class QuattrocentoCommandSequence(Enum):
     """
     Enum class for the different kind of command sequences.
-    """
 
-    _init_ = "value __doc__"
+    ACQ_SETT: Acquisition settings command sequence.
+    AN_OUT_IN_SEL: Select input source and gain for the analog output.
+    AN_OUT_CH_SEL: Select the channel for the analog output source.
+    IN_CONF: Configuration command sequence for the eight IN inputs or
+    configuration for the four MULTIPLE IN inputs.
+    CRC: Configuration command sequence byte (8 bits).
+    """
 
-    NONE = auto(), "None"
-    ACQ_SETT = auto(), "Acquisition settings command sequence"
-    AN_OUT_IN_SEL = auto(), "Select input source and gain for the analog output"
-    AN_OUT_CH_SEL = auto(), "Select the channel for the analog output source"
-    IN_CONF = auto(), (
-        "Configuration command sequence for the eight IN inputs or",
-        "configuration for the four MULTIPLE IN inputs",
-    )
-    CRC = auto(), "Configuration command sequence byte (8 bits)"
+    NONE = auto()
+    ACQ_SETT = auto()
+    AN_OUT_IN_SEL = auto()
+    AN_OUT_CH_SEL = auto()
+    IN_CONF = auto()
+    CRC = auto()
 
 
 # ------------ ACQ_SETT BYTE ------------
@@ -35,22 +37,17 @@ class QuattrocentoCommandSequence(Enum):
 class QuattrocentoDecimMode(Enum):
     """
     Enum class for the decimation bit of the Quattrocento device.
-    """
 
-    _init_ = "value __doc__"
+    INACTIVE: No decimation. The required sampling frequency is obtained
+    by sampling the signals directly at the desired sampling frequency.
+    ACTIVE: Decimation active. The required sampling frequency is
+    obtained by sampling all the signals at 10240 Hz and then sending
+    one sample out of 2, 5 or 20, to obtain the desired number of
+    sample per second.
+    """
 
-    INACTIVE = auto(), (
-        "Inactive. No decimation. The required sampling",
-        "frequency is obtained by sampling the signals",
-        "directly at the desired sampling frequency ",
-    )
-    ACTIVE = auto(), (
-        "Active. Decimation active.",
-        "The required sampling frequency is obtained by",
-        "sampling all the signals at 10240 Hz and then",
-        "sending one sample out of 2, 5 or 20, to obtain",
-        "the desired number of sample per second.",
-    )
+    INACTIVE = auto()
+    ACTIVE = auto()
 
 
 class QuattrocentoRecordingMode(Enum):
@@ -64,47 +61,56 @@ class QuattrocentoRecordingMode(Enum):
     recorded.
     """
 
-    _init_ = "value __doc__"
-
-    STOP = auto(), "Stop"
-    START = auto(), "Start"
+    STOP = auto()
+    START = auto()
 
 
 class QuattrocentoSamplingFrequencyMode(Enum):
     """
     Enum class for the sampling frequencies of the Quattrocento device (2 bits).
-    """
 
-    _init_ = "value __doc__"
+    LOW = 512 Hz, MEDIUM = 2048 Hz, HIGH = 5120 Hz, ULTRA = 10240 Hz.
+    """
 
-    LOW = auto(), "512 Hz"
-    MEDIUM = auto(), "2048 Hz"
-    HIGH = auto(), "5120 Hz"
-    ULTRA = auto(), "10240 Hz"
+    LOW = auto()
+    MEDIUM = auto()
+    HIGH = auto()
+    ULTRA = auto()
 
 
 class QuattrocentoNumberOfChannelsMode(Enum):
     """
     Enum class for the number of channels of the Quattrocento device (2 bits).
-    """
 
-    _init_ = "value __doc__"
+    LOW: IN1, IN2 and MULTIPLE_IN1 are active.
+    MEDIUM: IN1-IN4, MULTIPLE_IN1, MULTIPLE_IN2 are active.
+    HIGH: IN1-IN6, MULTIPLE_IN1-MULTIPLE_IN2 are active.
+    ULTRA: IN1-IN8, MULTIPLE_IN1-MULTIPLE_IN4 are active.
+    """
 
-    LOW = auto(), "IN1, IN2 and MULTIPLE_IN1 are active."
-    MEDIUM = auto(), "IN1-IN4, MULTIPLE_IN1, MULTIPLE_IN2 are active."
-    HIGH = auto(), "IN1-IN6, MULTIPLE_IN1-MULTIPLE_IN2 are active."
-    ULTRA = auto(), "IN1-IN8, MULTIPLE_IN1-MULTIPLE_IN4 are active."
+    LOW = auto()
+    MEDIUM = auto()
+    HIGH = auto()
+    ULTRA = auto()
 
 
 class QuattrocentoAcquisitionMode(Enum):
     """
     Enum class for the acquisition bit.
+
+    INACTIVE: Data sampling and transfer is not active.
+    ACTIVE: Data sampling and transfer is active.
     """
 
-    _init_ = "value __doc__"
+    INACTIVE = auto()
+    ACTIVE = auto()
+
+
+QUATTROCENTO_SAMPLING_FREQUENCIES: tuple[int, ...] = (512, 2048, 5120, 10240)
+"""Sampling frequencies in Hz, indexed by QuattrocentoSamplingFrequencyMode."""
 
-    INACTIVE = auto(), "Inactive. Data sampling and transfer is not active"
-    ACTIVE = auto(), "Active. Data sampling and transfer is active"
+QUATTROCENTO_CHANNEL_COUNTS: tuple[int, ...] = (120, 216, 312, 408)
+"""Streamed channel counts, indexed by QuattrocentoNumberOfChannelsMode."""
 
 
 class QuattrocentoAcqSettByte:
@@ -143,31 +149,15 @@ class QuattrocentoAcqSettByte:
 
     def _set_sampling_frequency(self) -> None:
         mode = self._sampling_frequency_mode
-        match mode:
-            case QuattrocentoSamplingFrequencyMode.LOW:
-                self._sampling_frequency = 512
-            case QuattrocentoSamplingFrequencyMode.MEDIUM:
-                self._sampling_frequency = 2048
-            case QuattrocentoSamplingFrequencyMode.HIGH:
-                self._sampling_frequency = 5120
-            case QuattrocentoSamplingFrequencyMode.ULTRA:
-                self._sampling_frequency = 10240
-            case _:
-                raise ValueError("Invalid sampling frequency mode.")
+        if not isinstance(mode, QuattrocentoSamplingFrequencyMode):
+            raise ValueError("Invalid sampling frequency mode.")
+        self._sampling_frequency = QUATTROCENTO_SAMPLING_FREQUENCIES[mode.value - 1]
 
     def _set_number_of_channels(self) -> None:
         mode = self._number_of_channels_mode
-        match mode:
-            case QuattrocentoNumberOfChannelsMode.LOW:
-                self._number_of_channels = 120
-            case QuattrocentoNumberOfChannelsMode.MEDIUM:
-                self._number_of_channels = 216
-            case QuattrocentoNumberOfChannelsMode.HIGH:
-                self._number_of_channels = 312
-            case QuattrocentoNumberOfChannelsMode.ULTRA:
-                self._number_of_channels = 408
-            case _:
-                raise ValueError("Invalid number of channels mode.")
+        if not isinstance(mode, QuattrocentoNumberOfChannelsMode):
+            raise ValueError("Invalid number of channels mode.")
+        self._number_of_channels = QUATTROCENTO_CHANNEL_COUNTS[mode.value - 1]
 
     def get_sampling_frequency(self) -> int:
         return self._sampling_frequency
@@ -218,11 +208,10 @@ class QuattrocentoSensorSelectionMode(Enum):
 class QuattrocentoSideMode(Enum):
     """"""
 
-    _init_ = "value __doc__"
-    UNDEFINED = auto(), "Undefined"
-    LEFT = auto(), "Left"
-    RIGHT = auto(), "Right"
-    NONE = auto(), "None"
+    UNDEFINED = auto()
+    LEFT = auto()
+    RIGHT = auto()
+    NONE = auto()
 
 
 # ---------- INX_CONF2 BYTE ----------
@@ -231,15 +220,16 @@ class QuattrocentoSideMode(Enum):
 class QuattrocentoHighPassFilterMode(Enum):
     """
     Enum class for the high-pass filter of INPUT INX or MULTIPLE INX (2 bits).
-    """
 
-    _init_ = "value __doc__"
+    NONE: no high-pass filter. LOW = 0.7 Hz, MEDIUM = 10 Hz,
+    HIGH = 100 Hz, ULTRA = 200 Hz.
+    """
 
-    NONE = auto(), "No high-pass filter"
-    LOW = auto(), "High-pass filter at 0.7 Hz"
-    MEDIUM = auto(), "High-pass filter at 10 Hz"
-    HIGH = auto(), "High-pass filter at 100 Hz"
-    ULTRA = auto(), "High-pass filter at 200 Hz"
+    NONE = auto()
+    LOW = auto()
+    MEDIUM = auto()
+    HIGH = auto()
+    ULTRA = auto()
 
 
 class QuattrocentoLowPassFilterMode(Enum):
@@ -251,12 +241,10 @@ class QuattrocentoLowPassFilterMode(Enum):
     3 -> ULTRA: 4400 Hz
     """
 
-    _init_ = "value __doc__"
-
-    LOW = auto(), "Low-pass filter at 130 Hz"
-    MEDIUM = auto(), "Low-pass filter at 500 Hz"
-    HIGH = auto(), "Low-pass filter at 900 Hz"
-    ULTRA = auto(), "Low-pass filter at 4400 Hz"
+    LOW = auto()
+    MEDIUM = auto()
+    HIGH = auto()
+    ULTRA = auto()
 
 
 class QuattrocentoDetectionMode(Enum):
@@ -264,11 +252,9 @@ class QuattrocentoDetectionMode(Enum):
     Enum class for the detection mode of the Quattrocento device (2 bits).
     """
 
-    _init_ = "value __doc_"
-
-    NONE = auto(), "No detection"
-    MONOPOLAR = auto(), "Monopolar detection"
-    BIPOLAR = auto(), "Bipolar detection"
+    NONE = auto()
+    MONOPOLAR = auto()
+    BIPOLAR = auto()
 
 
 class QuattrocentoINXConf2Byte:
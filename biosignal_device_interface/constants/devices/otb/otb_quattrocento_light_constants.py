@@ -1,4 +1,6 @@
-from aenum import Enum, auto
+from enum import Enum, auto
+from types import MappingProxyType
+from typing import Mapping
 
 
 # Quattrocento Light constants
@@ -12,48 +14,54 @@ CONNECTION_RESPONSE = b"OTBioLab"
 class QuattrocentoLightSamplingFrequency(Enum):
     """
     Enum class for the sampling frequencies of the Quattrocento Light device.
-    """
 
-    _init_ = "value __doc__"
+    LOW = 512 Hz, MEDIUM = 2048 Hz, HIGH = 5120 Hz, ULTRA = 10240 Hz.
+    """
 
-    LOW = auto(), "512 Hz"
-    MEDIUM = auto(), "2048 Hz"
-    HIGH = auto(), "5120 Hz"
-    ULTRA = auto(), "10240 Hz"
+    LOW = auto()
+    MEDIUM = auto()
+    HIGH = auto()
+    ULTRA = auto()
 
 
 class QuattrocentoLightStreamingFrequency(Enum):
     """
     Enum class for the streaming frequencies of the Quattrocento Light device.
-    """
 
-    _init_ = "value __doc__"
+    The member names spell out the streaming frequency in Hz.
+    """
 
-    ONE = auto(), "1 Hz"
-    TWO = auto(), "2 Hz"
-    FOUR = auto(), "4 Hz"
-    EIGHT = auto(), "8 Hz"
-    SIXTEEN = auto(), "16 Hz"
-    THIRTYTWO = auto(), "32 Hz"
+    ONE = auto()
+    TWO = auto()
+    FOUR = auto()
+    EIGHT = auto()
+    SIXTEEN = auto()
+    THIRTYTWO = auto()
 
 
-QUATTROCENTO_SAMPLING_FREQUENCY_DICT: dict[QuattrocentoLightSamplingFrequency, int] = {
-    QuattrocentoLightSamplingFrequency.LOW: 512,
-    QuattrocentoLightSamplingFrequency.MEDIUM: 2048,
-    QuattrocentoLightSamplingFrequency.HIGH: 5120,
-    QuattrocentoLightSamplingFrequency.ULTRA: 10240,
-}
+QUATTROCENTO_SAMPLING_FREQUENCY_DICT: Mapping[QuattrocentoLightSamplingFrequency, int] = (
+    MappingProxyType(
+        {
+            QuattrocentoLightSamplingFrequency.LOW: 512,
+            QuattrocentoLightSamplingFrequency.MEDIUM: 2048,
+            QuattrocentoLightSamplingFrequency.HIGH: 5120,
+            QuattrocentoLightSamplingFrequency.ULTRA: 10240,
+        }
+    )
+)
 """
 Dictionary to get sampling frequency for each mode.
 """
 
-QUATTROCENTO_LIGHT_STREAMING_FREQUENCY_DICT: dict[
+QUATTROCENTO_LIGHT_STREAMING_FREQUENCY_DICT: Mapping[
     QuattrocentoLightStreamingFrequency, int
-] = {
-    QuattrocentoLightStreamingFrequency.ONE: 1,
-    QuattrocentoLightStreamingFrequency.TWO: 2,
-    QuattrocentoLightStreamingFrequency.FOUR: 4,
-    QuattrocentoLightStreamingFrequency.EIGHT: 8,
-    QuattrocentoLightStreamingFrequency.SIXTEEN: 16,
-    QuattrocentoLightStreamingFrequency.THIRTYTWO: 32,
-}
+] = MappingProxyType(
+    {
+        QuattrocentoLightStreamingFrequency.ONE: 1,
+        QuattrocentoLightStreamingFrequency.TWO: 2,
+        QuattrocentoLightStreamingFrequency.FOUR: 4,
+        QuattrocentoLightStreamingFrequency.EIGHT: 8,
+        QuattrocentoLightStreamingFrequency.SIXTEEN: 16,
+        QuattrocentoLightStreamingFrequency.THIRTYTWO: 32,
+    }
+)
@@ -1,17 +1,58 @@
 # Import Devices to be used from biosignal_device_interface.devices
 # import Muovi, MindRoveBracelet, Quattrocento, QuattrocentoLight, ...
+#
+# The re-exports are resolved lazily (PEP 562) so that importing this
+# package does not pull in PySide6 until a device or widget class is
+# actually accessed.
 
-from biosignal_device_interface.devices.otb import (
-    OTBMuoviWidget,
-    OTBMuoviPlusWidget,
-    OTBQuattrocentoLightWidget,
-    OTBMuovi,
-    OTBQuattrocento,
-    OTBQuattrocentoLight,
-    OTBSyncStationWidget,
-    OTBDevicesWidget,
-)
+import importlib
 
-from biosignal_device_interface.gui.device_template_widgets.all_devices_widget import (
-    AllDevicesWidget,
-)
+_LAZY_IMPORTS: dict[str, str] = {
+    "OTBMuovi": "biosignal_device_interface.devices.otb.otb_muovi",
+    "OTBQuattrocento": "biosignal_device_interface.devices.otb.otb_quattrocento",
+    "OTBQuattrocentoLight": (
+        "biosignal_device_interface.devices.otb.otb_quattrocento_light"
+    ),
+    "OTBSyncStation": "biosignal_device_interface.devices.otb.otb_syncstation",
+    "OTBMuoviWidget": (
+        "biosignal_device_interface.gui.device_template_widgets.otb.otb_muovi_widget"
+    ),
+    "OTBMuoviPlusWidget": (
+        "biosignal_device_interface.gui.device_template_widgets.otb"
+        ".otb_muovi_plus_widget"
+    ),
+    "OTBQuattrocentoWidget": (
+        "biosignal_device_interface.gui.device_template_widgets.otb"
+        ".otb_quattrocento_widget"
+    ),
+    "OTBQuattrocentoLightWidget": (
+        "biosignal_device_interface.gui.device_template_widgets.otb"
+        ".otb_quattrocento_light_widget"
+    ),
+    "OTBSyncStationWidget": (
+        "biosignal_device_interface.gui.device_template_widgets.otb"
+        ".otb_syncstation_widget"
+    ),
+    "OTBDevicesWidget": (
+        "biosignal_device_interface.gui.device_template_widgets.otb"
+        ".otb_devices_widget"
+    ),
+    "AllDevicesWidget": (
+        "biosignal_device_interface.gui.device_template_widgets.all_devices_widget"
+    ),
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        attribute = getattr(module, name)
+        globals()[name] = attribute
+        return attribute
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
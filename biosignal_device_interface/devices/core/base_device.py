@@ -11,15 +11,14 @@ from typing import TYPE_CHECKING, Union, Dict, Tuple
 
 from abc import abstractmethod
 import socket
-import psutil
+import time
 from PySide6.QtCore import QObject, Signal, QTimer
 import numpy as np
-import re
 
 # Local Libraries
 from biosignal_device_interface.constants.devices.core.base_device_constants import (
     DeviceType,
-    DEVICE_NAME_DICT,
+    device_name,
 )
 
 # Type Checking
@@ -28,7 +27,24 @@ if TYPE_CHECKING:
     from PySide6.QtWidgets import QMainWindow, QWidget
     from PySide6.QtNetwork import QTcpSocket, QUdpSocket, QTcpServer
     from PySide6.QtSerialPort import QSerialPort
-    from aenum import Enum
+    from enum import Enum
+
+
+# Interface name fragments that identify WiFi adapters across platforms.
+_WIFI_INTERFACE_KEYWORDS: tuple[str, ...] = (
+    "wlan",
+    "wi-fi",
+    "wifi",
+    "wireless",
+    "en0",
+    "wlp",
+    "wln",
+)
+
+# Cached result of the last interface scan; enumerating all interfaces
+# through psutil is syscall-heavy and the GUI polls this repeatedly.
+_WIFI_ADDRESS_CACHE_TTL_S: float = 5.0
+_wifi_address_cache: tuple[float, list[str]] | None = None
 
 
 class BaseDevice(QObject):
@@ -40,25 +56,45 @@ class BaseDevice(QObject):
     biosignal_data_available: Signal = Signal(np.ndarray)
     auxiliary_data_available: Signal = Signal(np.ndarray)
 
+    # Keys of the dictionary returned by get_device_information
+    _INFORMATION_KEYS: tuple[str, ...] = (
+        "name",
+        "sampling_frequency",
+        "number_of_channels",
+        "number_of_biosignal_channels",
+        "number_of_auxiliary_channels",
+        "samples_per_frame",
+        "conversion_factor_biosignal",
+        "conversion_factor_auxiliary",
+    )
+
     def __init__(self, parent: Union[QMainWindow, QWidget] = None, **kwargs) -> None:
         super().__init__(parent)
 
         # Device Parameters
         self._device_type: DeviceType = None
+        # Display name resolved once on first use; _device_type is fixed
+        # after the subclass __init__.
+        self._device_name: str | None = None
 
         # Device Information
         self._sampling_frequency: int | None = None
         self._number_of_channels: int | None = None
         self._number_of_biosignal_channels: int | None = None
-        self._biosignal_channel_indices: list[int] | None = None
+        self._biosignal_channel_indices: np.ndarray | slice | None = None
         self._number_of_auxiliary_channels: int | None = None
-        self._auxiliary_channel_indices: list[int] | None = None
+        self._auxiliary_channel_indices: np.ndarray | slice | None = None
         self._samples_per_frame: int | None = None
         self._bytes_per_sample: int | None = None
 
         self._conversion_factor_biosignal: float = None  # Returns mV
         self._conversion_factor_auxiliary: float = None  # Returns mV
 
+        # Preallocated output buffers (allocated once in configure_device of
+        # the subclasses). Avoids allocating new arrays for every frame.
+        self._biosignal_data_buffer: np.ndarray | None = None
+        self._auxiliary_data_buffer: np.ndarray | None = None
+
         # Connection Parameters
         self._interface: QTcpServer | QTcpSocket | QUdpSocket | QSerialPort | None = (
             None
@@ -77,6 +113,10 @@ class BaseDevice(QObject):
         self._is_configured: bool = False
         self._is_streaming: bool = False
 
+        # Snapshot of the configurable attribute names, taken lazily on the
+        # first configure call once the subclass finished its __init__.
+        self._configurable_attribute_names: frozenset[str] | None = None
+
     @abstractmethod
     def _connect_to_device(self) -> bool:
         """
@@ -110,14 +150,14 @@ class BaseDevice(QObject):
         Device state is_connected is set to False.
         Signal connected_signal emits False.
 
+        Subclasses call _on_disconnected to update the state and
+        emit the signals.
+
         Returns:
             bool:
                 Success of the disconnection attempt.
         """
-        self.is_connected = False
-        self.connect_toggled.emit(False)
-        self._is_configured = False
-        self.configure_toggled.emit(False)
+        pass
 
     @abstractmethod
     def configure_device(self, params: Dict[str, Union[Enum, Dict[str, Enum]]]) -> None:  # type: ignore
@@ -128,6 +168,8 @@ class BaseDevice(QObject):
 
         E.g., enums/sessantaquattro.py
 
+        Subclasses call _update_configuration_parameters(params) to apply
+        the parameters to the device attributes.
 
         Args:
             params (Dict[str, Union[Enum, Dict[str, Enum]]]):
@@ -138,7 +180,7 @@ class BaseDevice(QObject):
                 and the second its respective value. Orient yourself on the
                 enums of the device to choose the correct configuration settings.
         """
-        self._update_configuration_parameters(params)
+        pass
 
     @abstractmethod
     def _start_streaming(self) -> None:
@@ -146,11 +188,10 @@ class BaseDevice(QObject):
         Sends the command to start the streaming to the device.
 
         if successful:
-            Device state is_streaming is set to True.
-            Signal streaming_signal emits True.
+            Subclasses call _on_streaming_started to update the state
+            and emit the signal.
         """
-        self._is_streaming = True
-        self.stream_toggled.emit(True)
+        pass
 
     @abstractmethod
     def _stop_streaming(self) -> None:
@@ -158,8 +199,30 @@ class BaseDevice(QObject):
         Sends the command to stop the streaing to the device
 
         if successful:
-            Device state is_streaming is set to False.
-            Signal streaming_signal emits False.
+            Subclasses call _on_streaming_stopped to update the state
+            and emit the signal.
+        """
+        pass
+
+    def _on_disconnected(self) -> None:
+        """
+        Updates the device state and emits the signals after a disconnect.
+        """
+        self.is_connected = False
+        self.connect_toggled.emit(False)
+        self._is_configured = False
+        self.configure_toggled.emit(False)
+
+    def _on_streaming_started(self) -> None:
+        """
+        Updates the device state and emits the signal when streaming starts.
+        """
+        self._is_streaming = True
+        self.stream_toggled.emit(True)
+
+    def _on_streaming_stopped(self) -> None:
+        """
+        Updates the device state and emits the signal when streaming stops.
         """
         self._is_streaming = False
         self.stream_toggled.emit(False)
@@ -220,15 +283,76 @@ class BaseDevice(QObject):
                 and the second its respective value. Orient yourself on the
                 enums of the device to choose the correct configuration settings.
         """
+        if self._configurable_attribute_names is None:
+            self._configurable_attribute_names = frozenset(self.__dict__)
+
         for key, value in params.items():
             key = "_" + key
-            if hasattr(self, key):
+            if key in self._configurable_attribute_names:
                 setattr(self, key, value)
             else:
                 print(
                     f"Attribute '{key}' not found in the class of {self._device_type.name}",
                 )
 
+    def _append_received_bytes(self, chunk: bytes | bytearray) -> None:
+        """
+        Appends a received chunk to the byte stream buffer in place.
+
+        Args:
+            chunk (bytes | bytearray):
+                Raw bytes read from the device interface.
+        """
+        self._received_bytes.extend(chunk)
+
+    def _consume_received_bytes(self, number_of_bytes: int) -> bytearray:
+        """
+        Removes and returns the first bytes of the byte stream buffer.
+
+        Consuming with del shifts the remaining bytes in place instead of
+        reallocating the buffer tail on every frame.
+
+        Args:
+            number_of_bytes (int):
+                Number of bytes to consume from the front of the buffer.
+
+        Returns:
+            bytearray:
+                The consumed bytes.
+        """
+        frame = self._received_bytes[:number_of_bytes]
+        del self._received_bytes[:number_of_bytes]
+        return frame
+
+    def _read_complete_frames(
+        self, streaming_socket: QTcpSocket | QUdpSocket
+    ) -> memoryview | None:
+        """
+        Reads the largest whole-frame multiple of the pending bytes from
+        the socket in a single call. Partial frames stay in the socket
+        buffer until the next readyRead, so no accumulation buffer is
+        needed on the Python side.
+
+        Args:
+            streaming_socket (QTcpSocket | QUdpSocket):
+                Socket that delivers the frame stream.
+
+        Returns:
+            memoryview | None:
+                Zero-copy view of the complete frames, or None when less
+                than one complete frame is pending.
+        """
+        bytes_available = streaming_socket.bytesAvailable()
+        if bytes_available <= self._buffer_size:
+            return None
+
+        number_of_frames = bytes_available // self._buffer_size
+        chunk = streaming_socket.read(number_of_frames * self._buffer_size)
+        if chunk.isEmpty():
+            return None
+
+        return memoryview(chunk)
+
     def _extract_biosignal_data(
         self, data: np.ndarray, milli_volts: bool = True
     ) -> np.ndarray:
@@ -247,10 +371,43 @@ class BaseDevice(QObject):
             np.ndarray:
                 Extracted biosignal channels.
         """
-        biosignal_data = data[self._biosignal_channel_indices]
         if milli_volts:
-            return biosignal_data * self._conversion_factor_biosignal
-        return biosignal_data
+            return self._extract_biosignal_milli_volts(data)
+        return self._extract_biosignal_raw(data)
+
+    def _extract_biosignal_raw(self, data: np.ndarray) -> np.ndarray:
+        """
+        Extracts the biosignal channels without unit conversion.
+
+        Contiguous channel blocks are described by a slice, which selects
+        the rows without building an index array; the result is copied so
+        the in-place milli volt conversion never touches the input frame.
+        """
+        indices = self._biosignal_channel_indices
+        if self._biosignal_data_buffer is not None:
+            if isinstance(indices, slice):
+                np.copyto(self._biosignal_data_buffer, data[indices])
+                return self._biosignal_data_buffer
+            return np.take(
+                data,
+                indices,
+                axis=0,
+                out=self._biosignal_data_buffer,
+            )
+        if isinstance(indices, slice):
+            return data[indices].copy()
+        return data[indices]
+
+    def _extract_biosignal_milli_volts(self, data: np.ndarray) -> np.ndarray:
+        """
+        Extracts the biosignal channels converted to milli volts.
+        """
+        biosignal_data = self._extract_biosignal_raw(data)
+        return np.multiply(
+            biosignal_data,
+            self._conversion_factor_biosignal,
+            out=biosignal_data,
+        )
 
     def _extract_auxiliary_data(
         self, data: np.ndarray, milli_volts: bool = True
@@ -271,11 +428,42 @@ class BaseDevice(QObject):
         """
 
         if milli_volts:
-            return (
-                data[self._auxiliary_channel_indices]
-                * self._conversion_factor_auxiliary
+            return self._extract_auxiliary_milli_volts(data)
+        return self._extract_auxiliary_raw(data)
+
+    def _extract_auxiliary_raw(self, data: np.ndarray) -> np.ndarray:
+        """
+        Extracts the auxiliary channels without unit conversion.
+
+        Contiguous channel blocks are described by a slice, which selects
+        the rows without building an index array; the result is copied so
+        the in-place milli volt conversion never touches the input frame.
+        """
+        indices = self._auxiliary_channel_indices
+        if self._auxiliary_data_buffer is not None:
+            if isinstance(indices, slice):
+                np.copyto(self._auxiliary_data_buffer, data[indices])
+                return self._auxiliary_data_buffer
+            return np.take(
+                data,
+                indices,
+                axis=0,
+                out=self._auxiliary_data_buffer,
             )
-        return data[self._auxiliary_channel_indices]
+        if isinstance(indices, slice):
+            return data[indices].copy()
+        return data[indices]
+
+    def _extract_auxiliary_milli_volts(self, data: np.ndarray) -> np.ndarray:
+        """
+        Extracts the auxiliary channels converted to milli volts.
+        """
+        auxiliary_data = self._extract_auxiliary_raw(data)
+        return np.multiply(
+            auxiliary_data,
+            self._conversion_factor_auxiliary,
+            out=auxiliary_data,
+        )
 
     def toggle_connection(self, settings: Tuple[str, int] = None) -> bool:
         """
@@ -331,16 +519,24 @@ class BaseDevice(QObject):
                 Dictionary that holds information about the
                 current device configuration and status.
         """
-        return {
-            "name": DEVICE_NAME_DICT[self._device_type],
-            "sampling_frequency": self._sampling_frequency,
-            "number_of_channels": self._number_of_channels,
-            "number_of_biosignal_channels": self._number_of_biosignal_channels,
-            "number_of_auxiliary_channels": self._number_of_auxiliary_channels,
-            "samples_per_frame": self._samples_per_frame,
-            "conversion_factor_biosignal": self._conversion_factor_biosignal,
-            "conversion_factor_auxiliary": self._conversion_factor_auxiliary,
-        }
+        if self._device_name is None:
+            self._device_name = device_name(self._device_type)
+
+        return dict(
+            zip(
+                self._INFORMATION_KEYS,
+                (
+                    self._device_name,
+                    self._sampling_frequency,
+                    self._number_of_channels,
+                    self._number_of_biosignal_channels,
+                    self._number_of_auxiliary_channels,
+                    self._samples_per_frame,
+                    self._conversion_factor_biosignal,
+                    self._conversion_factor_auxiliary,
+                ),
+            )
+        )
 
     def check_valid_ip(self, ip_address: str) -> bool:
         """
@@ -352,14 +548,21 @@ class BaseDevice(QObject):
         Returns:
             bool: True if IP is valid. False if not.
         """
-        ip_pattern = re.compile(
-            r"^([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\."
-            r"([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\."
-            r"([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\."
-            r"([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])$"
-        )
+        # Plain octet parsing; same acceptance as the former regex
+        # (0-255 per octet, no leading zeros) without the regex engine.
+        octets = ip_address.split(".")
+        if len(octets) != 4:
+            return False
+
+        for octet in octets:
+            if not octet.isdecimal() or len(octet) > 3:
+                return False
+            if len(octet) > 1 and octet[0] == "0":
+                return False
+            if int(octet) > 255:
+                return False
 
-        return bool(ip_pattern.match(ip_address))
+        return True
 
     def check_valid_port(self, port: str) -> bool:
         """
@@ -371,17 +574,29 @@ class BaseDevice(QObject):
         Returns:
             bool: True if port is valid. False if not.
         """
-        try:
-            port_num = int(port)
-            return 0 <= port_num <= 65535
-        except ValueError:
-            return False
+        # str.isdecimal rejects non-numeric input without the cost of an
+        # int() exception; int() is only reached for short digit strings.
+        return port.isdecimal() and 0 < len(port) <= 5 and int(port) <= 65535
 
     def get_server_wifi_ip_address(self) -> list[str]:
         """
         Returns the IP address of the host server.
+
+        The interface scan is cached for a few seconds since the GUI
+        polls this while the user sets up a connection.
         """
+        global _wifi_address_cache
+
+        if _wifi_address_cache is not None:
+            timestamp, cached_addresses = _wifi_address_cache
+            if time.monotonic() - timestamp < _WIFI_ADDRESS_CACHE_TTL_S:
+                return cached_addresses
+
         try:
+            # Imported lazily; psutil pulls in native extensions that are
+            # only needed when the WiFi IP is actually queried.
+            import psutil
+
             # Get all network interfaces
             interfaces = psutil.net_if_addrs()
 
@@ -389,24 +604,27 @@ class BaseDevice(QObject):
 
             # Iterate through interfaces to find the one associated with WiFi
             for interface, addresses in interfaces.items():
-                if (
-                    "wlan" in interface.lower()
-                    or "wi-fi" in interface.lower()
-                    or "wifi" in interface.lower()
-                    or "wireless" in interface.lower()
-                    or "en0" in interface.lower()
-                    or "wlp" in interface.lower()
-                    or "wln" in interface.lower()
+                interface_name = interface.lower()
+                if not any(
+                    keyword in interface_name for keyword in _WIFI_INTERFACE_KEYWORDS
                 ):
-                    for address in addresses:
-                        # Check if the address is an IPv4 address and not a loopback or virtual address
-                        if (
-                            address.family == socket.AF_INET
-                            and not address.address.startswith("127.")
-                        ):
-                            addresses_return.append(address.address)
-
-            return addresses_return[::-1] if addresses_return else [""]
+                    continue
+
+                for address in addresses:
+                    # Check if the address is an IPv4 address and not a loopback or virtual address
+                    if address.family == socket.AF_INET and not address.address.startswith(
+                        "127."
+                    ):
+                        addresses_return.append(address.address)
+
+            if addresses_return:
+                addresses_return.reverse()
+                result = addresses_return
+            else:
+                result = [""]
 
         except Exception:
-            return [""]
+            result = [""]
+
+        _wifi_address_cache = (time.monotonic(), result)
+        return result
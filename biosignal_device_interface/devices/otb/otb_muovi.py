@@ -6,8 +6,13 @@ Last Update: 2024-06-05
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Union, Dict
-from PySide6.QtNetwork import QTcpSocket, QTcpServer, QHostAddress
+from typing import TYPE_CHECKING, Callable, Union, Dict
+from PySide6.QtNetwork import (
+    QAbstractSocket,
+    QTcpSocket,
+    QTcpServer,
+    QHostAddress,
+)
 import numpy as np
 
 # Local Libraries
@@ -29,7 +34,7 @@ from biosignal_device_interface.constants.devices.otb.otb_muovi_constants import
 
 if TYPE_CHECKING:
     from PySide6.QtWidgets import QMainWindow, QWidget
-    from aenum import Enum
+    from enum import Enum
 
 
 class OTBMuovi(BaseDevice):
@@ -74,12 +79,15 @@ class OTBMuovi(BaseDevice):
         self._working_mode: MuoviWorkingMode = MuoviWorkingMode.NONE
         self._detection_mode: MuoviDetectionMode = MuoviDetectionMode.NONE
         self._configuration_command: int | None = None
+        self._command_idle: bytes | None = None
+        self._command_streaming: bytes | None = None
+        self._processed_data_buffer: np.ndarray | None = None
+        self._frame_buffer_pair: tuple | None = None
+        self._frame_buffer_index: int = 0
+        self._decode_frame: Callable[[bytearray | memoryview], np.ndarray] | None = None
 
     def _connect_to_device(self) -> bool:
-        super()._connect_to_device()
-
         self._interface = QTcpServer(self)
-        self._received_bytes: bytearray = bytearray()
 
         if not self._interface.listen(
             QHostAddress(self._connection_settings[0]), self._connection_settings[1]
@@ -93,17 +101,29 @@ class OTBMuovi(BaseDevice):
         return True
 
     def _make_request(self) -> bool:
-        super()._make_request()
         self._client_socket = self._interface.nextPendingConnection()
 
         if self._client_socket:
+            # A client connected; the timeout is a pure deadline and must
+            # not fire regardless of which branch handles the connection.
+            self._connection_timeout_timer.stop()
+
+            # Disable Nagle coalescing; the stream is latency-sensitive.
+            self._client_socket.setSocketOption(
+                QAbstractSocket.SocketOption.LowDelayOption, 1
+            )
+            # Room for many frames so short event-loop stalls do not
+            # back-pressure the device into retransmits.
+            self._client_socket.setSocketOption(
+                QAbstractSocket.SocketOption.ReceiveBufferSizeSocketOption,
+                1_048_576,
+            )
 
             self._client_socket.readyRead.connect(self._read_data)
 
             if not self.is_connected:
                 self.is_connected = True
                 self.connect_toggled.emit(self.is_connected)
-                self._connection_timeout_timer.stop()
                 return True
 
             elif not self._is_configured:
@@ -112,7 +132,7 @@ class OTBMuovi(BaseDevice):
                 return True
 
     def _disconnect_from_device(self) -> bool:
-        super()._disconnect_from_device()
+        self._on_disconnected()
 
         if self._client_socket is not None:
             self._client_socket.readyRead.disconnect(self._read_data)
@@ -127,7 +147,7 @@ class OTBMuovi(BaseDevice):
     def configure_device(
         self, params: Dict[str, Union[Enum, Dict[str, Enum]]]  # type: ignore
     ) -> None:
-        super().configure_device(params)
+        self._update_configuration_parameters(params)
 
         if not self.is_connected or self._client_socket is None:
             return
@@ -148,6 +168,14 @@ class OTBMuovi(BaseDevice):
         ]
         self._sampling_frequency = working_mode_characteristics["sampling_frequency"]
         self._bytes_per_sample = working_mode_characteristics["bytes_per_sample"]
+
+        # Bind the matching decoder once; the sample format cannot change
+        # while streaming, so the hot path needs no per-frame dispatch.
+        self._decode_frame = (
+            self._decode_eeg
+            if self._working_mode == MuoviWorkingMode.EEG
+            else self._decode_emg
+        )
         self._samples_per_frame = MUOVI_SAMPLES_PER_FRAME_DICT[self._device_type][
             self._working_mode
         ]
@@ -158,12 +186,16 @@ class OTBMuovi(BaseDevice):
         self._number_of_biosignal_channels = MUOVI_AVAILABLE_CHANNELS_DICT[
             self._device_type
         ][DeviceChannelTypes.BIOSIGNAL]
-        self._biosignal_channel_indices = np.arange(self._number_of_biosignal_channels)
+        # The Muovi channel layout is contiguous (biosignal channels first,
+        # auxiliary channels after), so slices select the blocks directly.
+        self._biosignal_channel_indices = slice(
+            0, self._number_of_biosignal_channels
+        )
 
         self._number_of_auxiliary_channels = MUOVI_AVAILABLE_CHANNELS_DICT[
             self._device_type
         ][DeviceChannelTypes.AUXILIARY]
-        self._auxiliary_channel_indices = np.arange(
+        self._auxiliary_channel_indices = slice(
             self._number_of_biosignal_channels,
             self._number_of_biosignal_channels + self._number_of_auxiliary_channels,
         )
@@ -172,119 +204,140 @@ class OTBMuovi(BaseDevice):
             self._number_of_channels * self._samples_per_frame * self._bytes_per_sample
         )
 
-        self._received_bytes = bytearray()
+        # Preallocate two sets of emitted frames and ping-pong between
+        # them, so a queued subscriber still sees a stable frame while
+        # the next one is being written.
+        self._frame_buffer_pair = tuple(
+            (
+                np.empty(
+                    (self._number_of_channels, self._samples_per_frame),
+                    dtype=np.float32,
+                ),
+                np.empty(
+                    (self._number_of_biosignal_channels, self._samples_per_frame),
+                    dtype=np.float32,
+                ),
+                np.empty(
+                    (self._number_of_auxiliary_channels, self._samples_per_frame),
+                    dtype=np.float32,
+                ),
+            )
+            for _ in range(2)
+        )
+        self._frame_buffer_index = 0
+        (
+            self._processed_data_buffer,
+            self._biosignal_data_buffer,
+            self._auxiliary_data_buffer,
+        ) = self._frame_buffer_pair[0]
 
         self._configure_command()
-        self._send_configuration_to_device()
-
-    def _send_configuration_to_device(self) -> None:
-        configuration_bytes = int(self._configuration_command).to_bytes(
-            1, byteorder="big"
-        )
+        self._send_configuration_to_device(self._command_idle)
 
-        success = self._client_socket.write(configuration_bytes)
+    def _send_configuration_to_device(self, command: bytes) -> None:
+        success = self._client_socket.write(command)
 
         if success == -1:
             self._disconnect_from_device()
 
     def _configure_command(self) -> None:
-        self._configuration_command = self._working_mode.value << 2
-        self._configuration_command += self._detection_mode.value
+        self._configuration_command = (
+            self._working_mode.value << 2
+        ) + self._detection_mode.value
+
+        # The low bit of the command toggles streaming; cache both
+        # variants once so start/stop just write the prebuilt byte.
+        self._command_idle = bytes([self._configuration_command])
+        self._command_streaming = bytes([self._configuration_command + 1])
 
     def _start_streaming(self) -> None:
-        super()._start_streaming()
+        self._on_streaming_started()
 
-        if self._configuration_command is None:
+        if self._command_streaming is None:
             return
 
-        self._configuration_command += 1
-        self._send_configuration_to_device()
+        self._send_configuration_to_device(self._command_streaming)
 
     def _stop_streaming(self) -> None:
-        super()._stop_streaming()
+        self._on_streaming_stopped()
 
-        if self._configuration_command is None:
+        if self._command_idle is None:
             return
 
-        self._configuration_command -= 1
-        self._send_configuration_to_device()
+        self._send_configuration_to_device(self._command_idle)
 
     def clear_socket(self) -> None:
         if self._client_socket is not None:
             self._client_socket.readAll()
 
     def _read_data(self) -> None:
-        super()._read_data()
-
         if not self._is_streaming:
             self.clear_socket()
             return
 
-        while self._client_socket.bytesAvailable() > self._buffer_size:
-            packet = self._client_socket.read(self._buffer_size)
-            if not packet:
-                continue
-
-            self._received_bytes.extend(packet)
-
-            while len(self._received_bytes) >= self._buffer_size:
-                data_to_process = self._received_bytes[: self._buffer_size]
-                self._process_data(data_to_process)
-                self._received_bytes = self._received_bytes[self._buffer_size :]
-
-    def _process_data(self, input: bytearray) -> None:
-        super()._process_data(input)
-
-        decoded_data = self._bytes_to_integers(input)
-
-        processed_data = decoded_data.reshape(
-            self._number_of_channels, -1, order="F"
-        ).astype(np.float32)
+        frames = self._read_complete_frames(self._client_socket)
+        if frames is None:
+            return
 
-        # Emit the data
-        self.data_available.emit(processed_data)
-        self.biosignal_data_available.emit(self._extract_biosignal_data(processed_data))
-        self.auxiliary_data_available.emit(self._extract_auxiliary_data(processed_data))
+        # All complete frames are decoded in one vectorized pass.
+        self._process_data(frames)
+
+    def _process_data(self, input: bytearray | memoryview) -> None:
+        # One decode pass covers every complete frame in the input; the
+        # device streams sample by sample, so consecutive frames form one
+        # (samples, channels) C-order block and .T is a zero-copy view of
+        # the (channels, samples) layout.
+        decoded_data = self._decode_frame(input)
+        all_samples = decoded_data.reshape(-1, self._number_of_channels).T
+
+        # Emit frame by frame; np.copyto casts to float32 while copying
+        # into the preallocated frame. Consecutive frames alternate
+        # between the two buffer sets, and the per-frame attribute
+        # lookups are hoisted to locals outside the loop.
+        samples_per_frame = self._samples_per_frame
+        buffer_pair = self._frame_buffer_pair
+        buffer_index = self._frame_buffer_index
+        emit_data = self.data_available.emit
+        emit_biosignal = self.biosignal_data_available.emit
+        emit_auxiliary = self.auxiliary_data_available.emit
+        extract_biosignal = self._extract_biosignal_milli_volts
+        extract_auxiliary = self._extract_auxiliary_milli_volts
+        for start in range(0, all_samples.shape[1], samples_per_frame):
+            (
+                processed_data,
+                self._biosignal_data_buffer,
+                self._auxiliary_data_buffer,
+            ) = buffer_pair[buffer_index]
+            self._processed_data_buffer = processed_data
+            buffer_index ^= 1
+
+            np.copyto(
+                processed_data,
+                all_samples[:, start : start + samples_per_frame],
+            )
+
+            emit_data(processed_data)
+            emit_biosignal(extract_biosignal(processed_data))
+            emit_auxiliary(extract_auxiliary(processed_data))
+        self._frame_buffer_index = buffer_index
+
+    # Convert channels from bytes to integers. The decoder matching the
+    # configured working mode is bound to self._decode_frame at configure
+    # time; both decode all samples in one vectorized pass.
+    def _decode_emg(self, data: bytearray | memoryview) -> np.ndarray:
+        # Big-endian 16 bit integers
+        return np.frombuffer(data, dtype=">i2")
+
+    def _decode_eeg(self, data: bytearray | memoryview) -> np.ndarray:
+        # Big-endian 24 bit integers: combine the byte triplets and
+        # sign-extend via two's complement. The shifts and ors run in
+        # place so only one int32 array is allocated.
+        raw_bytes = np.frombuffer(data, dtype=np.uint8)
+        values = raw_bytes[0::3].astype(np.int32)
+        values <<= 8
+        values |= raw_bytes[1::3]
+        values <<= 8
+        values |= raw_bytes[2::3]
+        values -= (values & 0x800000) << 1
+        return values
 
-    # Convert channels from bytes to integers
-    def _bytes_to_integers(
-        self,
-        data: bytearray,
-    ) -> np.ndarray:
-        channel_values = []
-        # Separate channels from byte-string. One channel has
-        # "bytes_in_sample" many bytes in it.
-        for channel_index in range(len(data) // 2):
-            channel_start = channel_index * self._bytes_per_sample
-            channel_end = (channel_index + 1) * self._bytes_per_sample
-            channel = data[channel_start:channel_end]
-
-            # Convert channel's byte value to integer
-            match self._working_mode:
-                case MuoviWorkingMode.EMG:
-                    value = self._decode_int16(channel)
-                case MuoviWorkingMode.EEG:
-                    value = self._decode_int24(channel)
-
-            channel_values.append(value)
-
-        return np.array(channel_values)
-
-    def _decode_int16(self, bytes_value: bytearray) -> int:
-        value = None
-        # Combine 2 bytes to a 16 bit integer value
-        value = bytes_value[0] * 2**8 + bytes_value[1]
-        # See if the value is negative and make the two's complement
-        if value >= 2**15:
-            value -= 2**16
-        return value
-
-    # Convert byte-array value to an integer value and apply two's complement
-    def _decode_int24(self, bytes_value: bytearray) -> int:
-        value = None
-        # Combine 3 bytes to a 24 bit integer value
-        value = bytes_value[0] * 2**16 + bytes_value[1] * 2**8 + bytes_value[2]
-        # See if the value is negative and make the two's complement
-        if value >= 2**23:
-            value -= 2**24
-        return value
@@ -10,7 +10,7 @@ Last Update: 2025-01-14
 # Python Libraries
 from __future__ import annotations
 from typing import TYPE_CHECKING, Union, Dict
-from PySide6.QtNetwork import QTcpSocket, QHostAddress
+from PySide6.QtNetwork import QAbstractSocket, QTcpSocket, QHostAddress
 from PySide6.QtCore import QIODevice
 import numpy as np
 
@@ -19,6 +19,9 @@ from biosignal_device_interface.devices.core.base_device import BaseDevice
 from biosignal_device_interface.constants.devices.core.base_device_constants import (
     DeviceType,
 )
+from biosignal_device_interface.constants.devices.otb.otb_constants import (
+    crc8_maxim,
+)
 from biosignal_device_interface.constants.devices.otb.otb_quattrocento_constants import (
     QUATTROCENTO_AUXILIARY_CHANNELS,
     QUATTROCENTO_BYTES_PER_SAMPLE,
@@ -37,7 +40,7 @@ from biosignal_device_interface.constants.devices.otb.otb_quattrocento_constants
 if TYPE_CHECKING:
     # Python Libraries
     from PySide6.QtWidgets import QMainWindow, QWidget
-    from aenum import Enum
+    from enum import Enum
 
 
 class OTBQuattrocento(BaseDevice):
@@ -89,16 +92,15 @@ class OTBQuattrocento(BaseDevice):
         self._grids: list[int] | None = None
 
         self._configuration_command: bytearray = bytearray(40)
+        self._decoded_frame_buffer: np.ndarray | None = None
+        self._processed_data_buffer: np.ndarray | None = None
+        self._frame_buffer_pair: tuple | None = None
+        self._frame_buffer_index: int = 0
 
     def _connect_to_device(self) -> bool:
-        super()._connect_to_device()
-
-        self._received_bytes: bytearray = bytearray()
         return self._make_request()
 
     def _make_request(self) -> bool:
-        super()._make_request()
-
         self._interface.connectToHost(
             QHostAddress(self._connection_settings[0]), self._connection_settings[1]
         )
@@ -107,6 +109,17 @@ class OTBQuattrocento(BaseDevice):
             self._disconnect_from_device()
             return False
 
+        # Disable Nagle coalescing; the stream is latency-sensitive.
+        self._interface.setSocketOption(
+            QAbstractSocket.SocketOption.LowDelayOption, 1
+        )
+        # Room for many frames so short event-loop stalls do not
+        # back-pressure the device into retransmits.
+        self._interface.setSocketOption(
+            QAbstractSocket.SocketOption.ReceiveBufferSizeSocketOption,
+            1_048_576,
+        )
+
         self._interface.readyRead.connect(self._read_data)
 
         self.is_connected = True
@@ -115,7 +128,7 @@ class OTBQuattrocento(BaseDevice):
         return True
 
     def _disconnect_from_device(self) -> None:
-        super()._disconnect_from_device()
+        self._on_disconnected()
 
         self._interface.disconnectFromHost()
         self._interface.readyRead.disconnect(self._read_data)
@@ -124,7 +137,7 @@ class OTBQuattrocento(BaseDevice):
     def configure_device(
         self, params: Dict[str, Union[Enum, Dict[str, Enum]]]  # type: ignore
     ):
-        super().configure_device(params)
+        self._update_configuration_parameters(params)
 
         self._sampling_frequency = self._acq_sett_configuration.get_sampling_frequency()
         self._number_of_streamed_channels = (
@@ -142,43 +155,37 @@ class OTBQuattrocento(BaseDevice):
         # Byte 3: Configure AN_OUT_CH_SEL
         self._configuration_command[2] = 0  # TODO:
 
+        # Each input configuration is a 24 bit big-endian field; build it
+        # once with to_bytes and assign the whole block in one slice.
         # Byte 4-15: Configure IN1-4 -> TODO: change that to individual configuration
-        for i in range(4):
-            config = int(self._input_top_left_configuration)
-            self._configuration_command[3 + i * 3] = (config >> 16) & 0xFF
-            self._configuration_command[4 + i * 3] = (config >> 8) & 0xFF
-            self._configuration_command[5 + i * 3] = config & 0xFF
+        self._configuration_command[3:15] = (
+            int(self._input_top_left_configuration).to_bytes(3, "big") * 4
+        )
 
         # Byte 16-27: Configure IN5-8 -> TODO: change that to individual configuration
-        for i in range(4):
-            config = int(self._input_top_right_configuration)
-            self._configuration_command[15 + i * 3] = (config >> 16) & 0xFF
-            self._configuration_command[16 + i * 3] = (config >> 8) & 0xFF
-            self._configuration_command[17 + i * 3] = config & 0xFF
+        self._configuration_command[15:27] = (
+            int(self._input_top_right_configuration).to_bytes(3, "big") * 4
+        )
 
         # Byte 28-30: Configure MULTIPLE IN 1
-        config = int(self._multiple_input_one_configuration)
-        self._configuration_command[27] = (config >> 16) & 0xFF
-        self._configuration_command[28] = (config >> 8) & 0xFF
-        self._configuration_command[29] = config & 0xFF
+        self._configuration_command[27:30] = int(
+            self._multiple_input_one_configuration
+        ).to_bytes(3, "big")
 
         # Byte 31-33: Configure MULTIPLE IN 2
-        config = int(self._multiple_input_two_configuration)
-        self._configuration_command[30] = (config >> 16) & 0xFF
-        self._configuration_command[31] = (config >> 8) & 0xFF
-        self._configuration_command[32] = config & 0xFF
+        self._configuration_command[30:33] = int(
+            self._multiple_input_two_configuration
+        ).to_bytes(3, "big")
 
         # Byte 34-36: Configure MULTIPLE IN 3
-        config = int(self._multiple_input_three_configuration)
-        self._configuration_command[33] = (config >> 16) & 0xFF
-        self._configuration_command[34] = (config >> 8) & 0xFF
-        self._configuration_command[35] = config & 0xFF
+        self._configuration_command[33:36] = int(
+            self._multiple_input_three_configuration
+        ).to_bytes(3, "big")
 
         # Byte 37-39: Configure MULTIPLE IN 4
-        config = int(self._multiple_input_four_configuration)
-        self._configuration_command[36] = (config >> 16) & 0xFF
-        self._configuration_command[37] = (config >> 8) & 0xFF
-        self._configuration_command[38] = config & 0xFF
+        self._configuration_command[36:39] = int(
+            self._multiple_input_four_configuration
+        ).to_bytes(3, "big")
 
         # Control Byte
         self._configuration_command[39] = self._crc_check(
@@ -192,15 +199,31 @@ class OTBQuattrocento(BaseDevice):
         )
 
         self._number_of_biosignal_channels = len(self._grids) * self._grid_size
-        self._biosignal_channel_indices = np.array(
+        biosignal_channel_indices = np.array(
             [
                 i * self._grid_size + j
                 for i in self._grids
                 for j in range(self._grid_size)
-            ]
+            ],
+            dtype=np.intp,
         )
+        # Grids selected as one contiguous block are extracted with a
+        # slice (plain row view, no gather); arbitrary grid selections
+        # keep the index-array path.
+        if biosignal_channel_indices.size and np.array_equal(
+            np.diff(biosignal_channel_indices),
+            np.ones(biosignal_channel_indices.size - 1, dtype=np.intp),
+        ):
+            self._biosignal_channel_indices = slice(
+                int(biosignal_channel_indices[0]),
+                int(biosignal_channel_indices[0]) + biosignal_channel_indices.size,
+            )
+        else:
+            self._biosignal_channel_indices = biosignal_channel_indices
         self._number_of_auxiliary_channels = QUATTROCENTO_AUXILIARY_CHANNELS
-        self._auxiliary_channel_indices = np.arange(
+        # The auxiliary channels always sit right before the supplementary
+        # channels at the end of the frame.
+        self._auxiliary_channel_indices = slice(
             self._number_of_streamed_channels
             - self._number_of_auxiliary_channels
             - QUATTROCENTO_SUPPLEMENTARY_CHANNELS,
@@ -213,6 +236,41 @@ class OTBQuattrocento(BaseDevice):
             self._number_of_streamed_channels * self._bytes_per_sample
         ) * self._samples_per_frame
 
+        # Preallocate the emitted frames once to avoid per-packet
+        # allocations. The biosignal and auxiliary buffers are row views
+        # into the processed frame, so filling them assembles the emitted
+        # frame in place without a per-frame vstack.
+        self._decoded_frame_buffer = np.empty(
+            (self._number_of_streamed_channels, self._samples_per_frame),
+            dtype=np.float32,
+        )
+        # Two processed frames are kept and alternated per frame
+        # (ping-pong), so a queued subscriber still sees a stable frame
+        # while the next one is being written.
+        frame_buffer_pair = []
+        for _ in range(2):
+            processed_data = np.empty(
+                (self._number_of_channels, self._samples_per_frame),
+                dtype=np.float32,
+            )
+            frame_buffer_pair.append(
+                (
+                    processed_data,
+                    processed_data[: self._number_of_biosignal_channels],
+                    processed_data[
+                        self._number_of_biosignal_channels : self._number_of_biosignal_channels
+                        + self._number_of_auxiliary_channels
+                    ],
+                )
+            )
+        self._frame_buffer_pair = tuple(frame_buffer_pair)
+        self._frame_buffer_index = 0
+        (
+            self._processed_data_buffer,
+            self._biosignal_data_buffer,
+            self._auxiliary_data_buffer,
+        ) = self._frame_buffer_pair[0]
+
         self._send_configuration_to_device()
 
     def _crc_check(self, command_bytes: bytearray, command_length: int) -> bytes:
@@ -232,33 +290,7 @@ class OTBQuattrocento(BaseDevice):
             bytes:
                 CRC of the transmitted bytes.
         """
-
-        crc = 0
-        j = 0
-
-        while command_length > 0:
-            extracted_byte = command_bytes[j]
-            for i in range(8, 0, -1):
-                sum = crc % 2 ^ extracted_byte % 2
-                crc = crc // 2
-
-                if sum > 0:
-                    crc_bin = format(crc, "08b")
-                    a_bin = format(140, "08b")
-
-                    str_list = []
-
-                    for k in range(8):
-                        str_list.append("0" if crc_bin[k] == a_bin[k] else "1")
-
-                    crc = int("".join(str_list), 2)
-
-                extracted_byte = extracted_byte // 2
-
-            command_length -= 1
-            j += 1
-
-        return crc
+        return crc8_maxim(command_bytes, command_length)
 
     def _send_configuration_to_device(self) -> None:
         success = self._interface.write(self._configuration_command)
@@ -270,7 +302,7 @@ class OTBQuattrocento(BaseDevice):
         self.configure_toggled.emit(self._is_configured)
 
     def _stop_streaming(self) -> None:
-        super()._stop_streaming()
+        self._on_streaming_stopped()
 
         self._configuration_command[0] -= 1
         self._configuration_command[39] = self._crc_check(
@@ -279,7 +311,7 @@ class OTBQuattrocento(BaseDevice):
         self._send_configuration_to_device()
 
     def _start_streaming(self) -> None:
-        super()._start_streaming()
+        self._on_streaming_started()
 
         self._configuration_command[0] += 1
         self._configuration_command[39] = self._crc_check(
@@ -295,37 +327,49 @@ class OTBQuattrocento(BaseDevice):
             self._interface.readAll()
 
     def _read_data(self) -> None:
-        super()._read_data()
-
         if not self._is_streaming:
             self.clear_socket()
             return
 
-        while self._interface.bytesAvailable() > self._buffer_size:
-            packet = self._interface.readAll()
-            if not packet:
-                continue
-
-            self._received_bytes.extend(packet)
-
-            while len(self._received_bytes) >= self._buffer_size:
-                data_to_process = self._received_bytes[: self._buffer_size]
-                self._process_data(data_to_process)
-                self._received_bytes = self._received_bytes[self._buffer_size :]
+        frames = self._read_complete_frames(self._interface)
+        if frames is None:
+            return
 
-    def _process_data(self, input: bytearray) -> None:
-        super()._process_data(input)
+        buffer_size = self._buffer_size
+        for start in range(0, frames.nbytes, buffer_size):
+            self._process_data(frames[start : start + buffer_size])
 
+    def _process_data(self, input: bytearray | memoryview) -> None:
+        # The wire format is sample-interleaved, so the decoded frame is
+        # (samples, channels) in C order; .T is a zero-copy view of the
+        # (channels, samples) layout and np.copyto casts to float32 while
+        # copying into the preallocated channel-major buffer. Contiguous
+        # channel rows keep the downstream extraction cache-friendly.
         data = np.frombuffer(input, dtype="<i2")
-        reshaped_data = data.reshape(
-            (self._number_of_streamed_channels, -1), order="F"
-        ).astype(np.float32)
-
-        biosignal_data = self._extract_biosignal_data(reshaped_data)
-        auxiliary_data = self._extract_auxiliary_data(reshaped_data)
-        supplementary_data = reshaped_data[-QUATTROCENTO_SUPPLEMENTARY_CHANNELS:]
+        reshaped_data = self._decoded_frame_buffer
+        np.copyto(
+            reshaped_data,
+            data.reshape(-1, self._number_of_streamed_channels).T,
+        )
 
-        processed_data = np.vstack((biosignal_data, auxiliary_data, supplementary_data))
+        # The extraction buffers are row views into the processed frame,
+        # so these calls fill the emitted frame in place; only the
+        # supplementary tail still needs an explicit copy. Consecutive
+        # frames alternate between the two buffer sets.
+        (
+            self._processed_data_buffer,
+            self._biosignal_data_buffer,
+            self._auxiliary_data_buffer,
+        ) = self._frame_buffer_pair[self._frame_buffer_index]
+        self._frame_buffer_index ^= 1
+
+        biosignal_data = self._extract_biosignal_milli_volts(reshaped_data)
+        auxiliary_data = self._extract_auxiliary_milli_volts(reshaped_data)
+        processed_data = self._processed_data_buffer
+        np.copyto(
+            processed_data[-QUATTROCENTO_SUPPLEMENTARY_CHANNELS:],
+            reshaped_data[-QUATTROCENTO_SUPPLEMENTARY_CHANNELS:],
+        )
 
         self.data_available.emit(processed_data)
         self.biosignal_data_available.emit(biosignal_data)
@@ -33,7 +33,7 @@ from biosignal_device_interface.constants.devices.otb.otb_quattrocento_light_con
 if TYPE_CHECKING:
     # Python Libraries
     from PySide6.QtWidgets import QMainWindow, QWidget
-    from aenum import Enum
+    from enum import Enum
 
 
 class OTBQuattrocentoLight(BaseDevice):
@@ -64,6 +64,7 @@ class OTBQuattrocentoLight(BaseDevice):
         self._bytes_per_sample: int = 2  # Fix value
         # Quattrocento unique parameters
         self._streaming_frequency: int | None = None
+        self._processed_data_buffer: np.ndarray | None = None
 
         # Connection Parameters
         self._interface: QTcpSocket = QTcpSocket()
@@ -77,13 +78,9 @@ class OTBQuattrocentoLight(BaseDevice):
         self._sampling_frequency_mode: QuattrocentoLightSamplingFrequency | None = None
 
     def _connect_to_device(self) -> bool:
-        super()._connect_to_device()
-
-        self._received_bytes: bytearray = bytearray()
         return self._make_request()
 
     def _make_request(self) -> bool:
-        super()._make_request()
         # Signal self.connect_toggled is emitted in _read_data
         self._interface.connectToHost(
             QHostAddress(self._connection_settings[0]),
@@ -100,7 +97,7 @@ class OTBQuattrocentoLight(BaseDevice):
         return True
 
     def _disconnect_from_device(self) -> None:
-        super()._disconnect_from_device()
+        self._on_disconnected()
 
         self._interface.disconnectFromHost()
         self._interface.readyRead.disconnect(self._read_data)
@@ -109,7 +106,7 @@ class OTBQuattrocentoLight(BaseDevice):
     def configure_device(
         self, params: Dict[str, Union[Enum, Dict[str, Enum]]]  # type: ignore
     ) -> None:
-        super().configure_device(params)
+        self._update_configuration_parameters(params)
 
         # Configure the device
         self._number_of_biosignal_channels = len(self._grids) * self._grid_size
@@ -118,14 +115,16 @@ class OTBQuattrocentoLight(BaseDevice):
                 i * self._grid_size + j
                 for i in self._grids
                 for j in range(self._grid_size)
-            ]
+            ],
+            dtype=np.intp,
         )
 
         self._auxiliary_channel_indices = np.array(
             [
                 i + self._auxiliary_channel_start_index
                 for i in range(self._number_of_auxiliary_channels)
-            ]
+            ],
+            dtype=np.intp,
         )
 
         self._streaming_frequency = QUATTROCENTO_LIGHT_STREAMING_FREQUENCY_DICT[
@@ -141,28 +140,37 @@ class OTBQuattrocentoLight(BaseDevice):
             self._bytes_per_sample * self._number_of_channels * self._samples_per_frame
         )
 
+        # Preallocate the emitted frames once to avoid per-packet allocations
+        self._processed_data_buffer = np.empty(
+            (self._number_of_channels, self._samples_per_frame), dtype=np.float32
+        )
+        self._biosignal_data_buffer = np.empty(
+            (self._number_of_biosignal_channels, self._samples_per_frame),
+            dtype=np.float32,
+        )
+        self._auxiliary_data_buffer = np.empty(
+            (self._number_of_auxiliary_channels, self._samples_per_frame),
+            dtype=np.float32,
+        )
+
         self._is_configured = True
         self.configure_toggled.emit(True)
 
     def _start_streaming(self) -> None:
-        super()._start_streaming()
+        self._on_streaming_started()
 
         self._interface.write(COMMAND_START_STREAMING)
 
     def _stop_streaming(self) -> None:
-        super()._stop_streaming()
+        self._on_streaming_stopped()
 
         self._interface.write(COMMAND_STOP_STREAMING)
         self._interface.waitForBytesWritten(1000)
 
     def clear_socket(self) -> None:
-        super().clear_socket()
-
         self._interface.readAll()
 
     def _read_data(self) -> None:
-        super()._read_data()
-
         # Wait for connection response
         if not self.is_connected and (
             self._interface.bytesAvailable() == len(CONNECTION_RESPONSE)
@@ -175,35 +183,31 @@ class OTBQuattrocentoLight(BaseDevice):
             self.clear_socket()
             return
 
-        while self._interface.bytesAvailable() > self._buffer_size:
-            packet = self._interface.read(self._buffer_size)
-            if not packet:
-                continue
-
-            self._received_bytes.extend(packet)
-
-            while len(self._received_bytes) >= self._buffer_size:
-                data_to_process = self._received_bytes[: self._buffer_size]
-                self._process_data(data_to_process)
-                self._received_bytes = self._received_bytes[self._buffer_size :]
+        frames = self._read_complete_frames(self._interface)
+        if frames is None:
+            return
 
-    def _process_data(self, input: bytearray) -> None:
-        super()._process_data(input)
+        buffer_size = self._buffer_size
+        for start in range(0, frames.nbytes, buffer_size):
+            self._process_data(frames[start : start + buffer_size])
 
+    def _process_data(self, input: bytearray | memoryview) -> None:
         # Decode the data
         decoded_data = np.frombuffer(input, dtype=np.int16)
 
-        # Reshape it to the correct format
-        processed_data = decoded_data.reshape(
-            self._number_of_channels, -1, order="F"
-        ).astype(np.float32)
+        # Reshape it to the correct format into the preallocated buffer
+        processed_data = self._processed_data_buffer
+        np.copyto(
+            processed_data,
+            decoded_data.reshape(self._number_of_channels, -1, order="F"),
+        )
 
         # Emit the data
         self.data_available.emit(processed_data)
 
-        biosignal_data = self._extract_biosignal_data(processed_data)
+        biosignal_data = self._extract_biosignal_milli_volts(processed_data)
         self.biosignal_data_available.emit(biosignal_data)
-        auxiliary_data = self._extract_auxiliary_data(processed_data)
+        auxiliary_data = self._extract_auxiliary_milli_volts(processed_data)
         self.auxiliary_data_available.emit(auxiliary_data)
 
     def get_device_information(self) -> Dict[str, Enum | int | float | str]:  # type: ignore
@@ -12,6 +12,9 @@ from PySide6.QtCore import QIODevice
 import numpy as np
 
 # Local Libraries
+from biosignal_device_interface.constants.devices.otb.otb_constants import (
+    crc8_maxim,
+)
 from biosignal_device_interface.constants.devices.otb.otb_syncstation_constants import (
     PROBE_CHARACTERISTICS_DICT,
     SYNCSTATION_CHARACTERISTICS_DICT,
@@ -30,7 +33,7 @@ from biosignal_device_interface.constants.devices.core.base_device_constants imp
 
 if TYPE_CHECKING:
     from PySide6.QtWidgets import QMainWindow, QWidget
-    from aenum import Enum
+    from enum import Enum
 
 
 class OTBSyncStation(BaseDevice):
@@ -70,14 +73,10 @@ class OTBSyncStation(BaseDevice):
         self._bytes_configuration_B: Dict[str, int] = None
 
     def _connect_to_device(self) -> bool:
-        super()._connect_to_device()
-
         self._received_bytes: bytearray = bytearray()
         self._make_request()
 
     def _make_request(self) -> bool:
-        super()._make_request()
-
         self._interface.connectToHost(
             QHostAddress(self._connection_settings[0]),
             self._connection_settings[1],
@@ -95,7 +94,7 @@ class OTBSyncStation(BaseDevice):
         return True
 
     def _disconnect_from_device(self) -> None:
-        super()._disconnect_from_device()
+        self._on_disconnected()
 
         self._interface.disconnectFromHost()
         self._interface.readyRead.disconnect(self._read_data)
@@ -105,7 +104,7 @@ class OTBSyncStation(BaseDevice):
         self.connect_toggled.emit(False)
 
     def configure_device(self, params) -> None:
-        super().configure_device(params)
+        self._update_configuration_parameters(params)
 
         success = self._configure_byte_sequence_A()
 
@@ -159,6 +158,7 @@ class OTBSyncStation(BaseDevice):
                     np.arange(
                         self._number_of_channels,
                         self._number_of_channels + biosignal_channels,
+                        dtype=np.intp,
                     )
                 )
 
@@ -166,6 +166,7 @@ class OTBSyncStation(BaseDevice):
                     np.arange(
                         self._number_of_channels + biosignal_channels,
                         self._number_of_channels + channels,
+                        dtype=np.intp,
                     )
                 )
 
@@ -228,33 +229,7 @@ class OTBSyncStation(BaseDevice):
             bytes:
                 CRC of the transmitted bytes.
         """
-
-        crc = 0
-        j = 0
-
-        while command_length > 0:
-            extracted_byte = command_bytes[j]
-            for i in range(8, 0, -1):
-                sum = crc % 2 ^ extracted_byte % 2
-                crc = crc // 2
-
-                if sum > 0:
-                    crc_bin = format(crc, "08b")
-                    a_bin = format(140, "08b")
-
-                    str_list = []
-
-                    for k in range(8):
-                        str_list.append("0" if crc_bin[k] == a_bin[k] else "1")
-
-                    crc = int("".join(str_list), 2)
-
-                extracted_byte = extracted_byte // 2
-
-            command_length -= 1
-            j += 1
-
-        return crc
+        return crc8_maxim(command_bytes, command_length)
 
     def _configure_byte_sequence_B(self) -> None:
         # TODO: Implement this method
@@ -303,23 +278,23 @@ class OTBSyncStation(BaseDevice):
             if self._interface.bytesAvailable() > 0:
 
                 packet = self._interface.readAll()
-                packet_bytearray = bytearray(packet.data())
 
-                if not packet_bytearray:
+                if packet.isEmpty():
                     return
 
-                self._received_bytes.extend(packet_bytearray)
+                # QByteArray exposes the buffer protocol, so extend copies
+                # the bytes once without intermediate conversions.
+                self._append_received_bytes(packet)
 
                 while len(self._received_bytes) >= self._buffer_size:
                     self._process_data(
-                        bytearray(self._received_bytes)[: self._buffer_size]
+                        self._consume_received_bytes(self._buffer_size)
                     )
-                    self._received_bytes = bytearray(self._received_bytes)[
-                        self._buffer_size :
-                    ]
 
     def _process_data(self, input: bytearray) -> None:
-        data: np.ndarray = np.frombuffer(input, dtype=np.uint8).astype(np.float32)
+        # Decode in integer arithmetic; the only float conversion happens
+        # when the decoded values are written to the float32 frame buffer.
+        data: np.ndarray = np.frombuffer(input, dtype=np.uint8).astype(np.int32)
 
         samples = self._samples_per_frame
         data = np.reshape(data, (samples, self._number_of_bytes)).T
@@ -327,8 +302,8 @@ class OTBSyncStation(BaseDevice):
 
         # Emit the data
         self.data_available.emit(processed_data)
-        self.biosignal_data_available.emit(self._extract_biosignal_data(processed_data))
-        self.auxiliary_data_available.emit(self._extract_auxiliary_data(processed_data))
+        self.biosignal_data_available.emit(self._extract_biosignal_milli_volts(processed_data))
+        self.auxiliary_data_available.emit(self._extract_auxiliary_milli_volts(processed_data))
 
     def _integer_to_bytes(self, command: int) -> bytes:
         return int(command).to_bytes(1, byteorder="big")
@@ -341,33 +316,31 @@ class OTBSyncStation(BaseDevice):
         samples = self._samples_per_frame
         frame_data = np.zeros((self._number_of_channels, samples), dtype=np.float32)
         channels_to_read = 0
+
+        # The working mode is the same for every probe; pick the decoder
+        # and byte stride once instead of branching inside the loop.
+        if self._working_mode == SyncStationWorkingMode.EMG:
+            decode = self._decode_int16
+            byte_stride = 2
+        else:
+            decode = self._decode_int24
+            byte_stride = 3
+
         for device in list(SyncStationProbeConfigMode)[1:]:
             if self._bytes_configuration_A[device]["probe_status"]:
                 channel_number = PROBE_CHARACTERISTICS_DICT[device][
                     DeviceChannelTypes.ALL
                 ]
                 # Convert channel's byte value to integer
-                if self._working_mode == SyncStationWorkingMode.EMG:
-                    channel_indices = (
-                        np.arange(0, channel_number * 2, 2) + channels_to_read * 2
-                    )
-                    data_sub_matrix = self._decode_int16(data, channel_indices)
-                    frame_data[
-                        channels_to_read : channels_to_read + channel_number, :
-                    ] = data_sub_matrix
-
-                elif self._working_mode == SyncStationWorkingMode.EEG:
-                    channel_indices = (
-                        np.arange(0, channel_number * 3, 3) + channels_to_read * 2
-                    )
-                    data_sub_matrix = self._decode_int24(data, channel_indices)
-                    frame_data[
-                        channels_to_read : channels_to_read + channel_number, :
-                    ] = data_sub_matrix
+                channel_indices = (
+                    np.arange(0, channel_number * byte_stride, byte_stride)
+                    + channels_to_read * 2
+                )
+                frame_data[
+                    channels_to_read : channels_to_read + channel_number, :
+                ] = decode(data, channel_indices)
 
                 channels_to_read += channel_number
-                del data_sub_matrix
-                del channel_indices
 
         syncstation_aux_bytes_number = (
             SYNCSTATION_CHARACTERISTICS_DICT[DeviceChannelTypes.ALL]
@@ -383,7 +356,7 @@ class OTBSyncStation(BaseDevice):
         )
         data_sub_matrix = self._decode_int16(data, channel_indices)
         frame_data[channels_to_read : channels_to_read + 6, :] = data_sub_matrix
-        return np.array(frame_data)
+        return frame_data
 
     def _decode_int24(
         self, data: np.ndarray, channel_indices: np.ndarray
@@ -20,7 +20,7 @@ from biosignal_device_interface.gui.ui_compiled.devices_template_widget import (
 )
 from biosignal_device_interface.constants.devices.core.base_device_constants import (
     DeviceType,
-    DEVICE_NAME_DICT,
+    device_name,
 )
 
 if TYPE_CHECKING:
@@ -94,7 +94,7 @@ class BaseMultipleDevicesWidget(QWidget):
     def _set_devices(self, devices: Dict[DeviceType, BaseDeviceWidget]) -> None:
         for device_type, device_widget in devices.items():
             self.device_stacked_widget.addWidget(device_widget)
-            self.device_selection_combo_box.addItem(DEVICE_NAME_DICT[device_type])
+            self.device_selection_combo_box.addItem(device_name(device_type))
 
         self._update_stacked_widget(0)
         self.device_selection_combo_box.currentIndexChanged.connect(
@@ -11,21 +11,29 @@ This example...
 # %% Step 1: Implement the device.
 #
 # %% Step 1.1: Add device type to the DeviceType Enum in biosignal_device_interface.constants.devices.base_device_constants.py.
-from aenum import Enum, auto
+from enum import Enum, auto
 
 
 class DeviceType(Enum):
     """
     Enum class for the different available devices.
-    Add new devices here.
+    Add new devices here and append the display name to DEVICE_NAMES.
     """
 
-    _init_ = "value __doc__"
-    OTB_QUATTROCENTO_LIGHT = auto(), "OT Bioelettronica Quattrocento Light"
-    OTB_MUOVI = auto(), "OT Bioelettronica Muovi"
-    OTB_MUOVI_PLUS = auto(), "OT Bioelettronica Muovi Plus"
+    OTB_QUATTROCENTO_LIGHT = auto()
+    OTB_MUOVI = auto()
+    OTB_MUOVI_PLUS = auto()
     # Add new device here
-    MANU_MYNAMEDEVICE = auto(), "Manufacturer MyNameDevice"
+    MANU_MYNAMEDEVICE = auto()
+
+
+DEVICE_NAMES: tuple[str, ...] = (
+    "OT Bioelettronica Quattrocento Light",
+    "OT Bioelettronica Muovi",
+    "OT Bioelettronica Muovi Plus",
+    # Add the display name of the new device here (same order as DeviceType)
+    "Manufacturer MyNameDevice",
+)
 
 
 # %% Step 1.2: Create a new Python file in the biosignal_device_interface/devices/ directory.
@@ -42,7 +50,7 @@ if TYPE_CHECKING:
     from PySide6.QtWidgets import QMainWindow, QWidget
     from PySide6.QtNetwork import QTcpServer, QTcpSocket, QUdpSocket
     from PySide6.QtSerialPort import QSerialPort
-    from aenum import Enum
+    from enum import Enum
 
 
 class MANUMyNameDevice(BaseDevice):
@@ -73,7 +81,8 @@ class MANUMyNameDevice(BaseDevice):
 
 
 # %% Step 1.3: Implement the abstract methods of the BaseDevice class.
-# Some methods need to call the super() method.
+# Some methods need to call the concrete base helpers that update the
+# device state and emit the signals.
 class MANUMyNameDevice(BaseDevice):
     def __init__(self, parent: Union[QMainWindow, QWidget] = None) -> None:
         super().__init__(parent)
@@ -86,16 +95,16 @@ class MANUMyNameDevice(BaseDevice):
         pass
 
     def _disconnect_from_device(self) -> bool:
-        super()._disconnect_from_device()
+        self._on_disconnected()
 
     def configure_device(self, params: Dict[str, Union[Enum, Dict[str, Enum]]]) -> None:
-        super().configure_device(params)
+        self._update_configuration_parameters(params)
 
     def _start_streaming(self) -> None:
-        super()._start_streaming()
+        self._on_streaming_started()
 
     def _stop_streaming(self) -> None:
-        super()._stop_streaming()
+        self._on_streaming_stopped()
 
     def clear_socket(self) -> None:
         pass
@@ -129,14 +138,14 @@ class MANUMyNameDevice(BaseDevice):
 class MyNameDeviceSamplingFrequency(Enum):
     """
     Enum class for the sampling frequencies of the Quattrocento Light device.
-    """
 
-    _init_ = "value __doc__"
+    LOW = 512 Hz, MEDIUM = 2048 Hz, HIGH = 5120 Hz, ULTRA = 10240 Hz.
+    """
 
-    LOW = auto(), "512 Hz"
-    MEDIUM = auto(), "2048 Hz"
-    HIGH = auto(), "5120 Hz"
-    ULTRA = auto(), "10240 Hz"
+    LOW = auto()
+    MEDIUM = auto()
+    HIGH = auto()
+    ULTRA = auto()
 
 
 MY_NAME_DEVICE_SAMPLING_FREQUENCY_DICT: dict[MyNameDeviceSamplingFrequency, int] = {
@@ -166,8 +175,8 @@ class MANUMyNameDevice(BaseDevice):
         self._sampling_frequency_mode: Enum | None = None
 
     def configure_device(self, params: Dict[str, Union[Enum, Dict[str, Enum]]]) -> None:
-        # Super call automatically sets the parameters to your device attributes.
-        super().configure_device(params)
+        # This call automatically sets the parameters to your device attributes.
+        self._update_configuration_parameters(params)
 
         # Get the actual value of your configuration mode from the dictionary
         self._sampling_frequency = MY_NAME_DEVICE_SAMPLING_FREQUENCY_DICT[